@@ -12,11 +12,15 @@
 # ]
 
 
+import re
 from dataclasses import dataclass, field
 from typing import List
 
 import requests
 
+# Matches the org/repo part of a commit url ie. org1/repo2 from https://github.com/org1/repo2/commits?author=zkoppert
+ORG_REPO_PATTERN = re.compile(r"github\.com/([^/]+/[^/]+)/commits")
+
 
 @dataclass
 class ContributorStats:
@@ -41,6 +45,20 @@ class ContributorStats:
     sponsor_info: str
     organizations: list[str] = field(default_factory=list)
 
+    def parsed_commit_urls(self) -> list[str]:
+        """The individual commit urls from the comma separated commit_url"""
+        return [url.strip() for url in self.commit_url.split(",") if url.strip()]
+
+    def markdown_commit_urls(self) -> list[str]:
+        """The commit urls as markdown links labelled with their org/repo"""
+        return [f"[{_org_repo_link_name(url)}]({url})" for url in self.parsed_commit_urls()]
+
+
+def _org_repo_link_name(url: str) -> str:
+    """Get the org/repo name from a commit url, falling back to the url itself"""
+    match = ORG_REPO_PATTERN.search(url)
+    return match.group(1) if match else url
+
 
 def is_new_contributor(username: str, returning_contributors: list) -> bool:
     """
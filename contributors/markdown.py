@@ -2,6 +2,7 @@
 """This module contains the functions needed to write the output to markdown files."""
 
 
+import io
 from collections import defaultdict, OrderedDict
 
 from .contributor_stats import ContributorStats
@@ -39,7 +40,7 @@ def write_to_markdown(
 
     """
     # Put together the contributor table
-    table, total_contributions = get_contributor_table(
+    table, total_contributions, new_contributor_count = get_contributor_table(
         collaborators,
         start_date,
         end_date,
@@ -51,7 +52,9 @@ def write_to_markdown(
     )
 
     # Put together the summary table including # of new contributions, # of new contributors, % new contributors, % returning contributors
-    summary_table = get_summary_table(collaborators, start_date, end_date, total_contributions)
+    summary_table = get_summary_table(
+        len(collaborators), new_contributor_count, start_date, end_date, total_contributions
+    )
 
     # Write the markdown file
     write_markdown_file(filename, start_date, end_date, organization, repository, table, summary_table)
@@ -67,43 +70,62 @@ def write_markdown_file(filename, start_date, end_date, organization, repository
         end_date (str): The end date of the date range for the contributor list.
         organization (str): The organization for which the contributors are being listed.
         repository (str): The repository for which the contributors are being listed.
-        table (str): A string containing a markdown table of the contributors and the total contribution count.
+        table (dict): The markdown table of contributors for each organization, with Independent last.
         summary_table (str): A string containing a markdown table of the summary statistics.
 
     Returns:
         None
 
     """
+    out = ["# Contributors\n\n"]
+    if start_date and end_date:
+        out.append(f"- Date range for contributor list:  {start_date} to {end_date}\n")
+    if organization:
+        out.append(f"- Organization: {organization}\n")
+    if repository:
+        out.append(f"- Repository: {repository}\n")
+    out.append("\n")
+    out.append(summary_table)
+
     with open(filename, "w", encoding="utf-8") as markdown_file:
-        markdown_file.write("# Contributors\n\n")
-        if start_date and end_date:
-            markdown_file.write(f"- Date range for contributor list:  {start_date} to {end_date}\n")
-        if organization:
-            markdown_file.write(f"- Organization: {organization}\n")
-        if repository:
-            markdown_file.write(f"- Repository: {repository}\n")
-        markdown_file.write("\n")
-        markdown_file.write(summary_table)
-        if len(table) == 1 and "Independent" in table:
-            markdown_file.write(table["Independent"])
-        else:
-            # Put independent last
-            for org in list(table.keys()):
-                org_title = f"## [{org}](https://github.com/{org})\n" if not org == "Independent" else f"## {org} \n"
-                markdown_file.write(org_title)
-                markdown_file.write(table[org])
+        markdown_file.write("".join(out))
+        stream_contributor_tables(markdown_file, table)
         markdown_file.write(
             "\n _this file was generated by the [Organizational Contributors GitHub Action](https://github.com/HCookie/organizational_contributors)_\n"
         )
 
 
-def get_summary_table(collaborators, start_date, end_date, total_contributions):
+def stream_contributor_tables(markdown_file, table):
+    """
+    This function writes each organization's contributor table to an open markdown file, one section at a time.
+
+    Args:
+        markdown_file (TextIO): The open markdown file to which the sections will be written.
+        table (dict): The markdown table of contributors for each organization, with Independent last.
+
+    Returns:
+        None
+
+    """
+    org_tables = dict(table)
+    independent_table = org_tables.pop("Independent", None)
+    for org, org_table in org_tables.items():
+        markdown_file.write(f"## [{org}](https://github.com/{org})\n")
+        markdown_file.write(org_table)
+    # Put independent last, without a heading when it is the only section
+    if independent_table is not None:
+        if org_tables:
+            markdown_file.write("## Independent \n")
+        markdown_file.write(independent_table)
+
+
+def get_summary_table(total_contributors, new_contributor_count, start_date, end_date, total_contributions):
     """
     This function returns a string containing a markdown table of the summary statistics.
 
     Args:
-        collaborators (list): A list of dictionaries, where each dictionary represents a collaborator.
-                              Each dictionary should have the keys 'username', 'contribution_count', and 'commits'.
+        total_contributors (int): The number of contributors in the report.
+        new_contributor_count (int): The number of contributors flagged as new contributors.
         start_date (str): The start date of the date range for the contributor list.
         end_date (str): The end date of the date range for the contributor list.
         total_contributions (int): The total number of contributions made by all of the contributors.
@@ -113,28 +135,19 @@ def get_summary_table(collaborators, start_date, end_date, total_contributions):
 
     """
     if start_date and end_date:
-        summary_table = "| Total Contributors | Total Contributions | % New Contributors |\n| --- | --- | --- |\n"
-        if len(collaborators) > 0:
-            new_contributors_percentage = round(
-                (len([x for x in collaborators if x.new_contributor is True])) / len(collaborators) * 100,
-                2,
-            )
+        if total_contributors > 0:
+            new_contributors_percentage = round(new_contributor_count / total_contributors * 100, 2)
         else:
             new_contributors_percentage = 0
-        summary_table += (
-            "| "
-            + str(len(collaborators))
-            + " | "
-            + str(total_contributions)
-            + " | "
-            + str(new_contributors_percentage)
-            + "% |\n\n"
+        return (
+            "| Total Contributors | Total Contributions | % New Contributors |\n| --- | --- | --- |\n"
+            f"| {total_contributors} | {total_contributions} | {new_contributors_percentage}% |\n\n"
         )
-    else:
-        summary_table = "| Total Contributors | Total Contributions |\n| --- | --- |\n"
-        summary_table += "| " + str(len(collaborators)) + " | " + str(total_contributions) + " |\n\n"
 
-    return summary_table
+    return (
+        "| Total Contributors | Total Contributions |\n| --- | --- |\n"
+        f"| {total_contributors} | {total_contributions} |\n\n"
+    )
 
 
 def get_contributor_table(
@@ -163,14 +176,19 @@ def get_contributor_table(
     Returns:
         table (str): A string containing a markdown table of the contributors and the total contribution count.
         total_contributions (int): The total number of contributions made by all of the contributors.
+        new_contributor_count (int): The number of contributors flagged as new contributors.
 
     """
+    has_new = bool(start_date and end_date)
+    has_sponsor = sponsor_info == "true"
+    link_prefix = "" if link_to_profile == "false" else "@"
+
     columns = ["Username", "All Time Contribution Count"]
-    if start_date and end_date:
+    if has_new:
         columns += ["New Contributor"]
-    if sponsor_info == "true":
+    if has_sponsor:
         columns += ["Sponsor URL"]
-    if start_date and end_date:
+    if has_new:
         columns += [f"Commits between {start_date} and {end_date}"]
     else:
         columns += ["All Commits"]
@@ -178,59 +196,84 @@ def get_contributor_table(
     headers = "| " + " | ".join(columns) + " |\n"
     headers += "| " + " | ".join(["---"] * len(columns)) + " |\n"
 
-    total_contributions = 0
+    row_fmt = "| %s%s | %s |" + (" %s |" if has_new else "") + (" %s |" if has_sponsor else "") + " %s |\n"
 
-    organization_contributors = defaultdict(list)
+    if not isinstance(repository, list):
+        repository = [repository]
+    multi_repo = len(repository) > 1
+    # Commit urls from more than one repository are shown as markdown links labelled with their org/repo
+    need_markdown_links = bool(organization) or multi_repo
 
-    for collaborator in collaborators:
-        total_contributions += collaborator.contribution_count
-        username = collaborator.username
-        contribution_count = collaborator.contribution_count
-        if repository:
-            commit_urls = collaborator.commit_url
-
-        if not isinstance(repository, list):
-            repository = [repository]
-        if organization or len(repository) > 1:
-            # split the urls from the comma separated list and make them into markdown links
-            commit_url_list = collaborator.commit_url.split(",")
-            commit_urls = ""
-            for url in commit_url_list:
-                url = url.strip()
-                # get the organization and repository name from the url ie. org1/repo2 from https://github.com/org1/repo2/commits?author-zkoppert
-                org_repo_link_name = url.split("/commits")[0].split("github.com/")[1]
-                url = f"[{org_repo_link_name}]({url})"
-                commit_urls += url + ", "
-        new_contributor = collaborator.new_contributor
-
-        row = f"| {'' if link_to_profile == 'false' else '@'}{username} | {contribution_count} |"
-        if "New Contributor" in columns:
-            row += f" {new_contributor} |"
-        if "Sponsor URL" in columns:
-            if collaborator.sponsor_info == "":
-                row += " not sponsorable |"
+    buckets = _bucket_collaborators(collaborators, show_organizations_list)
+
+    total_contributions = 0
+    new_contributor_count = 0
+    tables = OrderedDict()
+
+    for org, org_collaborators in buckets.items():
+        buf = io.StringIO()
+        buf.write(headers)
+        for collaborator in org_collaborators:
+            username = collaborator.username
+            contribution_count = collaborator.contribution_count
+            commit_url = collaborator.commit_url
+            new_contributor = collaborator.new_contributor
+            sponsor = collaborator.sponsor_info
+
+            total_contributions += contribution_count
+            if need_markdown_links:
+                commit_urls = ", ".join(collaborator.markdown_commit_urls()) + ", "
             else:
-                row += f" [Sponsor Link]({collaborator.sponsor_info}) |"
-        row += f" {commit_urls} |\n"
+                commit_urls = commit_url
+            if new_contributor is True:
+                new_contributor_count += 1
+
+            row_args = [link_prefix, username, contribution_count]
+            if has_new:
+                row_args.append(new_contributor)
+            if has_sponsor:
+                if sponsor == "":
+                    row_args.append("not sponsorable")
+                else:
+                    row_args.append(f"[Sponsor Link]({sponsor})")
+            row_args.append(commit_urls)
+            buf.write(row_fmt % tuple(row_args))
+        tables[org] = buf.getvalue()
+
+    return tables, total_contributions, new_contributor_count
+
+
+def _bucket_collaborators(
+    collaborators: list[ContributorStats], show_organizations_list: list[str]
+) -> OrderedDict[str, list[ContributorStats]]:
+    """
+    This function groups the collaborators by the first of their organizations that is shown.
 
-        added_to_org: bool = False
+    Args:
+        collaborators (list): A list of ContributorStats objects.
+        show_organizations_list (list): Organizations to show
+
+    Returns:
+        buckets (OrderedDict): The collaborators for each organization, with the shown organizations in the
+                               configured order, then any others picked up by "all", then Independent last.
 
-        for org in collaborator.organizations or []:
-            if org in show_organizations_list or "all" in show_organizations_list:
-                organization_contributors[org].append(row)
-                added_to_org = True
+    """
+    show_organizations_set = frozenset(show_organizations_list)
+    show_all = "all" in show_organizations_set
+
+    grouped: defaultdict[str, list[ContributorStats]] = defaultdict(list)
+    for collaborator in collaborators:
+        target = "Independent"
+        for org in collaborator.organizations or ():
+            if show_all or org in show_organizations_set:
+                target = org
                 break
+        grouped[target].append(collaborator)
 
-        if not added_to_org:
-            organization_contributors["Independent"].append(row)
-    
-    ordered_orgs = [org for org in (*show_organizations_list, "Independent") if org in organization_contributors]
-    tables = OrderedDict(
-        [
-            (org, headers + "".join(organization_contributors[org]))
-            for org in ordered_orgs
-        ]
-    )
+    # dict.fromkeys drops organizations repeated in show_organizations_list so each bucket is emitted once
+    ordered_orgs = dict.fromkeys(org for org in show_organizations_list if org in grouped and org != "Independent")
+    ordered_orgs.update(dict.fromkeys(org for org in grouped if org != "Independent"))
+    if "Independent" in grouped:
+        ordered_orgs["Independent"] = None
 
-    # table += row
-    return tables, total_contributions
+    return OrderedDict((org, grouped[org]) for org in ordered_orgs)
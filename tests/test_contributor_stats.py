@@ -43,6 +43,38 @@ class TestContributorStats(unittest.TestCase):
             "commit_url5",
         )
 
+    def test_markdown_commit_urls(self):
+        """
+        Test the parsed_commit_urls and markdown_commit_urls methods of the ContributorStats class.
+        """
+        contributor = ContributorStats(
+            "user1",
+            False,
+            "https://avatars.githubusercontent.com/u/",
+            100,
+            "https://github.com/org1/repo1/commits?author=user1, https://github.com/org1/repo2/commits?author=user1",
+            "",
+        )
+
+        self.assertEqual(
+            contributor.parsed_commit_urls(),
+            [
+                "https://github.com/org1/repo1/commits?author=user1",
+                "https://github.com/org1/repo2/commits?author=user1",
+            ],
+        )
+        self.assertEqual(
+            contributor.markdown_commit_urls(),
+            [
+                "[org1/repo1](https://github.com/org1/repo1/commits?author=user1)",
+                "[org1/repo2](https://github.com/org1/repo2/commits?author=user1)",
+            ],
+        )
+
+        # A url that does not match the org/repo pattern is used as its own link text
+        contributor.commit_url = "commit_url5"
+        self.assertEqual(contributor.markdown_commit_urls(), ["[commit_url5](commit_url5)"])
+
     def test_merge_contributors(self):
         """
         Test the merge_contributors function.
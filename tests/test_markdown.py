@@ -53,16 +53,19 @@ class TestMarkdown(unittest.TestCase):
         )
 
         mock_file.assert_called_once_with("filename", "w", encoding="utf-8")
-        mock_file().write.assert_any_call("# Contributors\n\n")
-        mock_file().write.assert_any_call("- Date range for contributor list:  2023-01-01 to 2023-01-02\n")
-        mock_file().write.assert_any_call(
+        self.assertEqual(
+            "".join(call.args[0] for call in mock_file().write.call_args_list),
+            "# Contributors\n\n"
+            "- Date range for contributor list:  2023-01-01 to 2023-01-02\n"
+            "- Repository: org/repo\n"
+            "\n"
             "| Total Contributors | Total Contributions | % New Contributors |\n| --- | --- | --- |\n| 2 | 300 | 50.0% |\n\n"
-        )
-        mock_file().write.assert_any_call(
             "| Username | All Time Contribution Count | New Contributor | Commits between 2023-01-01 and 2023-01-02 |\n"
             "| --- | --- | --- | --- |\n"
             "| @user1 | 100 | False | commit url |\n"
             "| @user2 | 200 | True | commit url2 |\n"
+            "\n _this file was generated by the [Organizational Contributors GitHub Action]"
+            "(https://github.com/HCookie/organizational_contributors)_\n",
         )
 
     @patch("builtins.open", new_callable=mock_open)
@@ -106,16 +109,19 @@ class TestMarkdown(unittest.TestCase):
         )
 
         mock_file.assert_called_once_with("filename", "w", encoding="utf-8")
-        mock_file().write.assert_any_call("# Contributors\n\n")
-        mock_file().write.assert_any_call("- Date range for contributor list:  2023-01-01 to 2023-01-02\n")
-        mock_file().write.assert_any_call(
+        self.assertEqual(
+            "".join(call.args[0] for call in mock_file().write.call_args_list),
+            "# Contributors\n\n"
+            "- Date range for contributor list:  2023-01-01 to 2023-01-02\n"
+            "- Repository: org/repo\n"
+            "\n"
             "| Total Contributors | Total Contributions | % New Contributors |\n| --- | --- | --- |\n| 2 | 300 | 50.0% |\n\n"
-        )
-        mock_file().write.assert_any_call(
             "| Username | All Time Contribution Count | New Contributor | Sponsor URL | Commits between 2023-01-01 and 2023-01-02 |\n"
             "| --- | --- | --- | --- | --- |\n"
             "| @user1 | 100 | False | [Sponsor Link](sponsor_url_1) | commit url |\n"
             "| @user2 | 200 | True | not sponsorable | commit url2 |\n"
+            "\n _this file was generated by the [Organizational Contributors GitHub Action]"
+            "(https://github.com/HCookie/organizational_contributors)_\n",
         )
 
     @patch("builtins.open", new_callable=mock_open)
@@ -159,16 +165,233 @@ class TestMarkdown(unittest.TestCase):
         )
 
         mock_file.assert_called_once_with("filename", "w", encoding="utf-8")
-        mock_file().write.assert_any_call("# Contributors\n\n")
-        mock_file().write.assert_any_call("- Date range for contributor list:  2023-01-01 to 2023-01-02\n")
-        mock_file().write.assert_any_call(
+        self.assertEqual(
+            "".join(call.args[0] for call in mock_file().write.call_args_list),
+            "# Contributors\n\n"
+            "- Date range for contributor list:  2023-01-01 to 2023-01-02\n"
+            "- Repository: org/repo\n"
+            "\n"
             "| Total Contributors | Total Contributions | % New Contributors |\n| --- | --- | --- |\n| 2 | 300 | 50.0% |\n\n"
-        )
-        mock_file().write.assert_any_call(
             "| Username | All Time Contribution Count | New Contributor | Commits between 2023-01-01 and 2023-01-02 |\n"
             "| --- | --- | --- | --- |\n"
             "| user1 | 100 | False | commit url |\n"
             "| user2 | 200 | True | commit url2 |\n"
+            "\n _this file was generated by the [Organizational Contributors GitHub Action]"
+            "(https://github.com/HCookie/organizational_contributors)_\n",
+        )
+
+    @patch("builtins.open", new_callable=mock_open)
+    def test_write_to_markdown_with_organization(self, mock_file):
+        """
+        Test the write_to_markdown function with an organization, which turns commit urls into markdown links.
+        """
+        person1 = contributor_stats.ContributorStats(
+            "user1",
+            False,
+            "url",
+            100,
+            "https://github.com/org1/repo1/commits?author=user1, https://github.com/org1/repo2/commits?author=user1",
+            "",
+        )
+        collaborators = [person1]
+
+        write_to_markdown(
+            collaborators,
+            "filename",
+            None,
+            None,
+            "org1",
+            None,
+            "false",
+            "true",
+            [],
+        )
+
+        self.assertEqual(
+            "".join(call.args[0] for call in mock_file().write.call_args_list),
+            "# Contributors\n\n"
+            "- Organization: org1\n"
+            "\n"
+            "| Total Contributors | Total Contributions |\n| --- | --- |\n| 1 | 100 |\n\n"
+            "| Username | All Time Contribution Count | All Commits |\n"
+            "| --- | --- | --- |\n"
+            "| @user1 | 100 | [org1/repo1](https://github.com/org1/repo1/commits?author=user1), "
+            "[org1/repo2](https://github.com/org1/repo2/commits?author=user1),  |\n"
+            "\n _this file was generated by the [Organizational Contributors GitHub Action]"
+            "(https://github.com/HCookie/organizational_contributors)_\n",
+        )
+
+    @patch("builtins.open", new_callable=mock_open)
+    def test_write_to_markdown_with_organization_sections(self, mock_file):
+        """
+        Test the write_to_markdown function groups contributors into organization sections with Independent last.
+        """
+        person1 = contributor_stats.ContributorStats(
+            "user1",
+            False,
+            "url",
+            100,
+            "commit url",
+            "",
+        )
+        person2 = contributor_stats.ContributorStats(
+            "user2",
+            False,
+            "url2",
+            200,
+            "commit url2",
+            "",
+            ["org1"],
+        )
+        collaborators = [
+            person1,
+            person2,
+        ]
+
+        write_to_markdown(
+            collaborators,
+            "filename",
+            None,
+            None,
+            None,
+            "org/repo",
+            "false",
+            "true",
+            ["org1"],
+        )
+
+        self.assertEqual(
+            "".join(call.args[0] for call in mock_file().write.call_args_list),
+            "# Contributors\n\n"
+            "- Repository: org/repo\n"
+            "\n"
+            "| Total Contributors | Total Contributions |\n| --- | --- |\n| 2 | 300 |\n\n"
+            "## [org1](https://github.com/org1)\n"
+            "| Username | All Time Contribution Count | All Commits |\n"
+            "| --- | --- | --- |\n"
+            "| @user2 | 200 | commit url2 |\n"
+            "## Independent \n"
+            "| Username | All Time Contribution Count | All Commits |\n"
+            "| --- | --- | --- |\n"
+            "| @user1 | 100 | commit url |\n"
+            "\n _this file was generated by the [Organizational Contributors GitHub Action]"
+            "(https://github.com/HCookie/organizational_contributors)_\n",
+        )
+
+    @patch("builtins.open", new_callable=mock_open)
+    def test_write_to_markdown_with_all_organizations(self, mock_file):
+        """
+        Test the write_to_markdown function shows every organization when show_organizations_list is 'all'.
+        """
+        person1 = contributor_stats.ContributorStats(
+            "user1",
+            False,
+            "url",
+            100,
+            "commit url",
+            "",
+            ["org2"],
+        )
+        person2 = contributor_stats.ContributorStats(
+            "user2",
+            False,
+            "url2",
+            200,
+            "commit url2",
+            "",
+            ["org1"],
+        )
+        collaborators = [
+            person1,
+            person2,
+        ]
+
+        write_to_markdown(
+            collaborators,
+            "filename",
+            None,
+            None,
+            None,
+            "org/repo",
+            "false",
+            "true",
+            ["all"],
+        )
+
+        self.assertEqual(
+            "".join(call.args[0] for call in mock_file().write.call_args_list),
+            "# Contributors\n\n"
+            "- Repository: org/repo\n"
+            "\n"
+            "| Total Contributors | Total Contributions |\n| --- | --- |\n| 2 | 300 |\n\n"
+            "## [org2](https://github.com/org2)\n"
+            "| Username | All Time Contribution Count | All Commits |\n"
+            "| --- | --- | --- |\n"
+            "| @user1 | 100 | commit url |\n"
+            "## [org1](https://github.com/org1)\n"
+            "| Username | All Time Contribution Count | All Commits |\n"
+            "| --- | --- | --- |\n"
+            "| @user2 | 200 | commit url2 |\n"
+            "\n _this file was generated by the [Organizational Contributors GitHub Action]"
+            "(https://github.com/HCookie/organizational_contributors)_\n",
+        )
+
+    @patch("builtins.open", new_callable=mock_open)
+    def test_write_to_markdown_with_repeated_organization(self, mock_file):
+        """
+        Test the write_to_markdown function counts each contributor once when an organization is listed twice.
+        """
+        person1 = contributor_stats.ContributorStats(
+            "user1",
+            True,
+            "url",
+            100,
+            "commit url",
+            "",
+            ["org1"],
+        )
+        person2 = contributor_stats.ContributorStats(
+            "user2",
+            False,
+            "url2",
+            5,
+            "commit url2",
+            "",
+        )
+        collaborators = [
+            person1,
+            person2,
+        ]
+
+        write_to_markdown(
+            collaborators,
+            "filename",
+            "2023-01-01",
+            "2023-01-02",
+            None,
+            "org/repo",
+            "false",
+            "true",
+            ["org1", "org1"],
+        )
+
+        self.assertEqual(
+            "".join(call.args[0] for call in mock_file().write.call_args_list),
+            "# Contributors\n\n"
+            "- Date range for contributor list:  2023-01-01 to 2023-01-02\n"
+            "- Repository: org/repo\n"
+            "\n"
+            "| Total Contributors | Total Contributions | % New Contributors |\n| --- | --- | --- |\n| 2 | 105 | 50.0% |\n\n"
+            "## [org1](https://github.com/org1)\n"
+            "| Username | All Time Contribution Count | New Contributor | Commits between 2023-01-01 and 2023-01-02 |\n"
+            "| --- | --- | --- | --- |\n"
+            "| @user1 | 100 | True | commit url |\n"
+            "## Independent \n"
+            "| Username | All Time Contribution Count | New Contributor | Commits between 2023-01-01 and 2023-01-02 |\n"
+            "| --- | --- | --- | --- |\n"
+            "| @user2 | 5 | False | commit url2 |\n"
+            "\n _this file was generated by the [Organizational Contributors GitHub Action]"
+            "(https://github.com/HCookie/organizational_contributors)_\n",
         )
 
 